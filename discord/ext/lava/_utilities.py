@@ -1,13 +1,20 @@
 import functools
 import itertools
+import json
 import re
 from collections.abc import Callable, Iterable
 from typing import Any
 
 import aiohttp
 import discord.utils
+from discord.utils import HAS_ORJSON
 
-from .types.common import JSON, JSONLoads
+from .types.common import JSON, JSONDumps, JSONLoads
+
+
+# discord.py has already checked whether orjson is installed.
+if HAS_ORJSON:
+    import orjson  # type: ignore
 
 
 def ordinal(number: int) -> str:
@@ -34,6 +41,17 @@ async def json_or_text(response: aiohttp.ClientResponse, json_loads: JSONLoads)
     return text
 
 
+# pick the implementation once at import rather than checking for orjson on every call.
+default_json_dumps: JSONDumps = orjson.dumps if HAS_ORJSON else json.dumps  # pyright: ignore
+default_json_loads: JSONLoads = orjson.loads if HAS_ORJSON else json.loads  # pyright: ignore
+
+
+def json_dumps_pretty(obj: Any, /) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()  # pyright: ignore
+    return json.dumps(obj, indent=4)
+
+
 class DeferredMessage:
 
     def __init__[**P](self, callable: Callable[P, str], *args: P.args, **kwargs: P.kwargs) -> None:
@@ -9,6 +9,7 @@ __all__ = [
     "LinkNotReady",
     "PlayerError",
     "PlayerAlreadyConnected",
+    "PlayerUpdateFailed",
     "SearchError",
     "SearchFailed",
     "NoSearchResults",
@@ -43,6 +44,10 @@ class PlayerAlreadyConnected(PlayerError):
     pass
 
 
+class PlayerUpdateFailed(PlayerError):
+    pass
+
+
 class SearchError(LavaError):
     pass
 
@@ -1,6 +1,5 @@
 import asyncio
 import itertools
-import json as _json
 import logging
 import random
 import string
@@ -12,7 +11,8 @@ import aiohttp
 import spotipy
 
 from ._backoff import Backoff
-from ._utilities import SPOTIFY_REGEX, DeferredMessage, chunks, json_or_text, ordinal
+from ._utilities import SPOTIFY_REGEX, DeferredMessage, chunks, default_json_dumps, default_json_loads
+from ._utilities import json_dumps_pretty, json_or_text, ordinal
 from .exceptions import LinkAlreadyConnected, LinkConnectionError, NoSearchResults, SearchError, SearchFailed
 from .objects.playlist import Playlist
 from .objects.result import Result
@@ -64,8 +64,9 @@ class Link(Generic[PlayerT]):
         self._password: str = password
         self._user_id: int = user_id
 
-        self._json_dumps: JSONDumps = json_dumps or _json.dumps
-        self._json_loads: JSONLoads = json_loads or _json.loads
+        # defaults to orjson if it's installed, otherwise the standard library json module.
+        self._json_dumps: JSONDumps = json_dumps or default_json_dumps
+        self._json_loads: JSONLoads = json_loads or default_json_loads
 
         self._spotify: spotipy.Client | None = spotipy.Client(
             client_id=spotify_client_id,
@@ -168,37 +169,38 @@ class Link(Generic[PlayerT]):
             await self._session.close()
         self._session = None
 
-    async def _process_payload(self, payload: Payload, /) -> None:
-        __ws_log__.debug(
-            f"Link '{self.identifier}' received a '{payload['op']}' payload.\n%s",
-            DeferredMessage(_json.dumps, payload, indent=4),
-        )
+    def _process_payload(self, payload: Payload, /) -> None:
+        if __ws_log__.isEnabledFor(logging.DEBUG):
+            __ws_log__.debug(
+                "Link '%s' received a '%s' payload.\n%s",
+                self.identifier, payload["op"], DeferredMessage(json_dumps_pretty, payload),
+            )
         match payload["op"]:
             case "ready":
                 self._session_id = payload["sessionId"]
                 self._ready_event.set()
-                __ws_log__.info(f"Link '{self.identifier}' is ready.")
+                __ws_log__.info("Link '%s' is ready.", self.identifier)
             case "stats":
                 self._stats = Stats(payload)
             case "event":
                 if not (player := self._players.get(int(payload["guildId"]))):
                     __ws_log__.warning(
-                        f"Link '{self.identifier}' received a '{payload['type']}' event for a non-existent player "
-                        f"with id '{payload['guildId']}'."
+                        "Link '%s' received a '%s' event for a non-existent player with id '%s'.",
+                        self.identifier, payload["type"], payload["guildId"],
                     )
                     return
                 player._dispatch_event(payload)
             case "playerUpdate":
                 if not (player := self._players.get(int(payload["guildId"]))):
                     __ws_log__.warning(
-                        f"Link '{self.identifier}' received a player update for a non-existent player "
-                        f"with id '{payload['guildId']}'."
+                        "Link '%s' received a player update for a non-existent player with id '%s'.",
+                        self.identifier, payload["guildId"],
                     )
                     return
                 player._update_player_state(payload["state"])
             case _:  # pyright: ignore - lavalink could add new op codes.
                 __ws_log__.error(
-                    f"Link '{self.identifier}' received a payload with an unhandled op code: '{payload["op"]}'."
+                    "Link '%s' received a payload with an unhandled op code: '%s'.", self.identifier, payload["op"],
                 )
 
     async def _listen(self) -> None:
@@ -242,11 +244,12 @@ class Link(Generic[PlayerT]):
                     __ws_log__.info(f"Link '{self.identifier}' was able to reconnect to its websocket.")
                     continue
 
-            asyncio.create_task(
-                self._process_payload(
-                    cast(Payload, self._json_loads(message.data))
-                )
-            )
+            # payloads are processed synchronously, spawning a task per frame costs more than the processing itself.
+            # a bad payload must not kill the listener though, so log the error and move on to the next frame.
+            try:
+                self._process_payload(cast(Payload, self._json_loads(message.data)))
+            except Exception:
+                __ws_log__.exception("Link '%s' raised an error while processing a payload.", self.identifier)
 
     # rest
 
@@ -272,15 +275,16 @@ class Link(Generic[PlayerT]):
 
         async with self._session.request(method, url, **kwargs) as response:
             response_data = await json_or_text(response, json_loads=self._json_loads)
-            __rest_log__.debug(
-                f"{method} -> '{url}' -> {response.status}.\n"
-                f"Request Parameters:{"\n" if parameters else " "}%s\n"
-                f"Request Data:{"\n" if data else " "}%s\n"
-                f"Response Data:{"\n" if response_data else " "}%s",
-                DeferredMessage(_json.dumps, parameters or {}, indent=4),
-                DeferredMessage(_json.dumps, data or {}, indent=4),
-                DeferredMessage(_json.dumps, response_data or {}, indent=4),
-            )
+            if __rest_log__.isEnabledFor(logging.DEBUG):
+                __rest_log__.debug(
+                    f"{method} -> '{url}' -> {response.status}.\n"
+                    f"Request Parameters:{"\n" if parameters else " "}%s\n"
+                    f"Request Data:{"\n" if data else " "}%s\n"
+                    f"Response Data:{"\n" if response_data else " "}%s",
+                    DeferredMessage(json_dumps_pretty, parameters or {}),
+                    DeferredMessage(json_dumps_pretty, data or {}),
+                    DeferredMessage(json_dumps_pretty, response_data or {}),
+                )
             if 200 <= response.status < 300:
                 return response_data
 
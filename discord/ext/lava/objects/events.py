@@ -3,6 +3,7 @@ from __future__ import annotations
 from ..enums import ExceptionSeverity, TrackEndReason
 from ..types.objects.events import EventData, EventType, TrackEndEventData, TrackEventData
 from ..types.objects.events import TrackExceptionEventData, TrackStuckEventData, WebSocketClosedEventData
+from ..types.objects.track import TrackData
 from .track import Track
 
 
@@ -25,14 +26,22 @@ class _BaseEvent:
 
 
 class _BaseTrackEvent(_BaseEvent):
-    __slots__ = ("track",)
+    __slots__ = ("_track_data", "_track",)
 
     def __init__(self, data: TrackEventData) -> None:
         super().__init__(data)
-        self.track: Track = Track(data["track"])
+        self._track_data: TrackData = data["track"]
+        self._track: Track | None = None
+
+    @property
+    def track(self) -> Track:
+        if self._track is None:
+            self._track = Track(self._track_data)
+        return self._track
 
 
 class TrackStartEvent(_BaseTrackEvent):
+    __slots__ = ()
 
     def __repr__(self) -> str:
         return f"<lava.{self.__class__.__name__}: track='{self.track}'>"
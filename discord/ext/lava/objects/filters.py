@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import abc
 import collections
-from typing import Self
+import functools
+import operator
+from typing import Any, ClassVar, Self
 
 from ..types.objects.filters import ChannelMixData, DistortionData, EqualizerData, FiltersData, KaraokeData
 from ..types.objects.filters import LowPassData, RotationData, TimescaleData, TremoloData, VibratoData
@@ -22,20 +23,65 @@ __all__ = [
 ]
 
 
-class _FilterBase(metaclass=abc.ABCMeta):
-    __slots__ = ()
+def _validate_range(
+    name: str,
+    value: float,
+    /, *,
+    minimum: float,
+    maximum: float | None = None,
+    minimum_inclusive: bool = True,
+) -> None:
+    if (value < minimum if minimum_inclusive else value <= minimum) or (maximum is not None and value > maximum):
+        conditions = [f"more than{" or equal to" if minimum_inclusive else ""} {minimum}"]
+        if maximum is not None:
+            conditions.append(f"less than or equal to {maximum}")
+        raise ValueError(f"'{name}' must be {" and ".join(conditions)}.")
+
+
+def _freeze(value: Any, /) -> Any:
+    if isinstance(value, dict):
+        # dicts compare equal regardless of key order, so their frozen form has to be unordered as well.
+        return frozenset((key, _freeze(item)) for key, item in value.items())  # type: ignore
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)  # type: ignore
+    return value
+
+
+class _FilterBase[DataT]:
+    __slots__ = ("_data",)
+
+    _repr_template: ClassVar[str]
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        attributes = [f"{x.lstrip("_")}=%s" for x in cls.__slots__]
+        cls._repr_template = f"<lava.{cls.__name__}: {", ".join(attributes)}>"
 
     def __repr__(self) -> str:
-        attributes = [f"{x.lstrip("_")}={getattr(self, x)}" for x in self.__slots__]
-        return f"<lava.{self.__class__.__name__}: {", ".join(attributes)}>"
+        return self._repr_template % tuple(getattr(self, x) for x in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.data == other.data  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash((type(self), _freeze(self.data)))
 
     @property
-    @abc.abstractmethod
-    def data(self) -> ...:
+    def data(self) -> DataT:
+        # filters are immutable, so their payloads only ever need to be built once.
+        try:
+            return self._data
+        except AttributeError:
+            self._data: DataT = self._construct_data()
+            return self._data
+
+    def _construct_data(self) -> DataT:
         raise NotImplementedError
 
 
-class Equalizer(_FilterBase):
+class Equalizer(_FilterBase[EqualizerData]):
     __slots__ = ("_bands",)
 
     def __init__(self, *, bands: list[tuple[int, float]] | None = None) -> None:
@@ -46,12 +92,11 @@ class Equalizer(_FilterBase):
                 raise ValueError("Equalizer bands must be between 0 and 14 and gains must be between -0.25 and 1.0.")
             self._bands.update(bands)
 
-    @property
-    def data(self) -> EqualizerData:
+    def _construct_data(self) -> EqualizerData:
         return [{"band": band, "gain": self._bands[band]} for band in range(15)]
 
 
-class Karaoke(_FilterBase):
+class Karaoke(_FilterBase[KaraokeData]):
     __slots__ = ("_level", "_mono_level", "_filter_band", "_filter_width",)
 
     def __init__(
@@ -67,8 +112,7 @@ class Karaoke(_FilterBase):
         self._filter_band: float = filter_band
         self._filter_width: float = filter_width
 
-    @property
-    def data(self) -> KaraokeData:
+    def _construct_data(self) -> KaraokeData:
         return {
             "level":       self._level,
             "monoLevel":   self._mono_level,
@@ -77,7 +121,7 @@ class Karaoke(_FilterBase):
         }
 
 
-class Timescale(_FilterBase):
+class Timescale(_FilterBase[TimescaleData]):
     __slots__ = ("_pitch", "_speed", "_rate",)
 
     def __init__(
@@ -87,19 +131,15 @@ class Timescale(_FilterBase):
         speed: float = 1.0,
         rate: float = 1.0,
     ) -> None:
-        if pitch < 0.0:
-            raise ValueError("'pitch' must be more than or equal to 0.0.")
-        if speed < 0.0:
-            raise ValueError("'speed' must be more than or equal to 0.0.")
-        if rate < 0.0:
-            raise ValueError("'rate' must be more than or equal to 0.0.")
+        _validate_range("pitch", pitch, minimum=0.0)
+        _validate_range("speed", speed, minimum=0.0)
+        _validate_range("rate", rate, minimum=0.0)
 
         self._pitch: float = pitch
         self._speed: float = speed
         self._rate: float = rate
 
-    @property
-    def data(self) -> TimescaleData:
+    def _construct_data(self) -> TimescaleData:
         return {
             "pitch": self._pitch,
             "speed": self._speed,
@@ -107,7 +147,7 @@ class Timescale(_FilterBase):
         }
 
 
-class Tremolo(_FilterBase):
+class Tremolo(_FilterBase[TremoloData]):
     __slots__ = ("_frequency", "_depth",)
 
     def __init__(
@@ -116,23 +156,20 @@ class Tremolo(_FilterBase):
         frequency: float = 2.0,
         depth: float = 0.0
     ) -> None:
-        if frequency <= 0.0:
-            raise ValueError("'frequency' must be more than 0.0.")
-        if depth <= 0.0 or depth > 1.0:
-            raise ValueError("'depth' must be more than 0.0 and less than or equal to 1.0.")
+        _validate_range("frequency", frequency, minimum=0.0, minimum_inclusive=False)
+        _validate_range("depth", depth, minimum=0.0, maximum=1.0, minimum_inclusive=False)
 
         self._frequency: float = frequency
         self._depth: float = depth
 
-    @property
-    def data(self) -> TremoloData:
+    def _construct_data(self) -> TremoloData:
         return {
             "frequency": self._frequency,
             "depth":     self._depth,
         }
 
 
-class Vibrato(_FilterBase):
+class Vibrato(_FilterBase[VibratoData]):
     __slots__ = ("_frequency", "_depth",)
 
     def __init__(
@@ -141,34 +178,30 @@ class Vibrato(_FilterBase):
         frequency: float = 2.0,
         depth: float = 0.0
     ) -> None:
-        if frequency <= 0.0 or frequency > 14.0:
-            raise ValueError("'frequency' must be more than 0.0 and less than or equal to 14.0.")
-        if depth <= 0.0 or depth > 1.0:
-            raise ValueError("'depth' must be more than 0.0 and less than or equal to 1.0.")
+        _validate_range("frequency", frequency, minimum=0.0, maximum=14.0, minimum_inclusive=False)
+        _validate_range("depth", depth, minimum=0.0, maximum=1.0, minimum_inclusive=False)
 
         self._frequency: float = frequency
         self._depth: float = depth
 
-    @property
-    def data(self) -> VibratoData:
+    def _construct_data(self) -> VibratoData:
         return {
             "frequency": self._frequency,
             "depth":     self._depth,
         }
 
 
-class Rotation(_FilterBase):
+class Rotation(_FilterBase[RotationData]):
     __slots__ = ("_speed",)
 
     def __init__(self, *, speed: float = 0.0) -> None:
         self._speed: float = speed
 
-    @property
-    def data(self) -> RotationData:
+    def _construct_data(self) -> RotationData:
         return {"rotationHz": self._speed}
 
 
-class Distortion(_FilterBase):
+class Distortion(_FilterBase[DistortionData]):
     __slots__ = (
         "_sin_offset", "_sin_scale", "_cos_offset", "_cos_scale", "_tan_offset", "_tan_scale", "_offset", "_scale",
     )
@@ -194,8 +227,7 @@ class Distortion(_FilterBase):
         self._offset: float = offset
         self._scale: float = scale
 
-    @property
-    def data(self) -> DistortionData:
+    def _construct_data(self) -> DistortionData:
         return {
             "sinOffset": self._sin_offset,
             "sinScale":  self._sin_scale,
@@ -208,7 +240,7 @@ class Distortion(_FilterBase):
         }
 
 
-class ChannelMix(_FilterBase):
+class ChannelMix(_FilterBase[ChannelMixData]):
     __slots__ = ("_left_to_left", "_left_to_right", "_right_to_left", "_right_to_right",)
 
     def __init__(
@@ -219,10 +251,8 @@ class ChannelMix(_FilterBase):
         right_to_left: float = 0.0,
         right_to_right: float = 1.0,
     ) -> None:
-        if any(
-            value for value in (left_to_left, left_to_right, right_to_left, right_to_right)
-            if value < 0.0 or value > 1.0
-        ):
+        values = (left_to_left, left_to_right, right_to_left, right_to_right)
+        if min(values) < 0.0 or max(values) > 1.0:
             raise ValueError(
                 "'left_to_left', 'left_to_right', 'right_to_left', and 'right_to_right' "
                 "must all be more than or equal to 0.0 and less than or equal to 1.0"
@@ -233,8 +263,7 @@ class ChannelMix(_FilterBase):
         self._right_to_left: float = right_to_left
         self._right_to_right: float = right_to_right
 
-    @property
-    def data(self) -> ChannelMixData:
+    def _construct_data(self) -> ChannelMixData:
         return {
             "leftToLeft":   self._left_to_left,
             "leftToRight":  self._left_to_right,
@@ -243,49 +272,61 @@ class ChannelMix(_FilterBase):
         }
 
     @classmethod
+    @functools.cache
     def mono(cls) -> Self:
         return cls(left_to_left=0.5, left_to_right=0.5, right_to_left=0.5, right_to_right=0.5)
 
     @classmethod
+    @functools.cache
     def switch(cls) -> Self:
         return cls(left_to_left=0.0, left_to_right=1.0, right_to_left=1.0, right_to_right=0.0)
 
     @classmethod
+    @functools.cache
     def only_left(cls) -> Self:
         return cls(left_to_left=1.0, left_to_right=0.0, right_to_left=0.0, right_to_right=0.0)
 
     @classmethod
+    @functools.cache
     def full_left(cls) -> Self:
         return cls(left_to_left=0.5, left_to_right=0.0, right_to_left=0.5, right_to_right=0.0)
 
     @classmethod
+    @functools.cache
     def only_right(cls) -> Self:
         return cls(left_to_left=0.0, left_to_right=0.0, right_to_left=0.0, right_to_right=1.0)
 
     @classmethod
+    @functools.cache
     def full_right(cls) -> Self:
         return cls(left_to_left=0.0, left_to_right=0.5, right_to_left=0.0, right_to_right=0.5)
 
 
-class LowPass(_FilterBase):
+class LowPass(_FilterBase[LowPassData]):
     __slots__ = ("_smoothing",)
 
     def __init__(self, *, smoothing: float = 1.0) -> None:
-        if smoothing < 1.0:
-            raise ValueError("'smoothing' must be more than or equal to 1.0.")
+        _validate_range("smoothing", smoothing, minimum=1.0)
         self._smoothing: float = smoothing
 
-    @property
-    def data(self) -> LowPassData:
+    def _construct_data(self) -> LowPassData:
         return {"smoothing": self._smoothing}
 
 
-class Filter(_FilterBase):
+class Filter(_FilterBase[FiltersData]):
     __slots__ = (
         "_filter", "_equalizer", "_karaoke", "_timescale", "_tremolo", "_vibrato", "_rotation", "_distortion",
         "_channel_mix", "_low_pass",
     )
 
+    _COMPONENT_KEYS: ClassVar[tuple[str, ...]] = (
+        "equalizer", "karaoke", "timescale", "tremolo", "vibrato", "rotation", "distortion", "channelMix", "lowPass",
+    )
+    _get_components: ClassVar[operator.attrgetter[Any]] = operator.attrgetter(
+        "_equalizer", "_karaoke", "_timescale", "_tremolo", "_vibrato", "_rotation", "_distortion", "_channel_mix",
+        "_low_pass",
+    )
+
     def __init__(
         self,
         filter: Filter | None = None,
@@ -310,27 +351,13 @@ class Filter(_FilterBase):
         self._channel_mix: ChannelMix | None = channel_mix
         self._low_pass: LowPass | None = low_pass
 
-    @property
-    def data(self) -> FiltersData:
-        payload: FiltersData = self._filter.data if self._filter else {}
-
-        if self._equalizer:
-            payload["equalizer"] = self._equalizer.data
-        if self._karaoke:
-            payload["karaoke"] = self._karaoke.data
-        if self._timescale:
-            payload["timescale"] = self._timescale.data
-        if self._tremolo:
-            payload["tremolo"] = self._tremolo.data
-        if self._vibrato:
-            payload["vibrato"] = self._vibrato.data
-        if self._rotation:
-            payload["rotation"] = self._rotation.data
-        if self._distortion:
-            payload["distortion"] = self._distortion.data
-        if self._channel_mix:
-            payload["channelMix"] = self._channel_mix.data
-        if self._low_pass:
-            payload["lowPass"] = self._low_pass.data
-
+    def _construct_data(self) -> FiltersData:
+        inherited: FiltersData = self._filter.data if self._filter is not None else {}
+        payload: FiltersData = {}
+        # build the payload in a fixed key order, regardless of which filter each component came from
+        for key, component in zip(self._COMPONENT_KEYS, self._get_components(self)):
+            if component is not None:
+                payload[key] = component.data  # type: ignore
+            elif key in inherited:
+                payload[key] = inherited[key]  # type: ignore
         return payload
@@ -19,7 +19,7 @@ class Playlist:
         info = data["info"]
         self.name: str = info["name"]
         self.selected_track: int = info["selectedTrack"]
-        self.tracks: list[Track] = [Track(track) for track in data["tracks"]]
+        self.tracks: list[Track] = list(map(Track, data["tracks"]))
 
     def __repr__(self) -> str:
         return f"<lava.{self.__class__.__name__}: name='{self.name}', selected_track={self.selected_track}>"
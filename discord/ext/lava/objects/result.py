@@ -9,6 +9,7 @@ __all__ = ["Result"]
 
 
 class Result:
+    __slots__ = ("source", "tracks",)
 
     def __init__(
         self,
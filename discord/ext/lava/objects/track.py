@@ -59,11 +59,11 @@ class Track:
             isrc = None
         else:
             identifier = track.id
-            author = ", ".join(artist.name for artist in track.artists)
+            author = ", ".join([artist.name for artist in track.artists])
             title = track.name
-            artwork_url = track.album.images[0].url if len(track.album.images) > 0 else None
+            artwork_url = images[0].url if (images := track.album.images) else None
             isrc = track.external_ids.get("isrc")
-        return Track(
+        return cls(
             {
                 "encoded":    MISSING,
                 "info":       {
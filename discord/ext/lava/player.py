@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
 import time
-from typing import Generic, cast
+from typing import Generic
 from typing_extensions import TypeVar
 
 import discord
 import discord.types.voice
 
-from ._utilities import MISSING, DeferredMessage, get_event_dispatch_name
-from .exceptions import PlayerAlreadyConnected, PlayerNotConnected
+from ._utilities import MISSING, DeferredMessage, get_event_dispatch_name, json_dumps_pretty
+from .exceptions import PlayerAlreadyConnected, PlayerNotConnected, PlayerUpdateFailed
 from .link import Link
 from .objects.events import TrackEndEvent, TrackExceptionEvent, TrackStartEvent, TrackStuckEvent
 from .objects.events import UnhandledEvent, WebSocketClosedEvent
@@ -32,28 +31,57 @@ type Connectable = discord.abc.Connectable
 type VoiceStateUpdateData = discord.types.voice.GuildVoiceState
 type VoiceServerUpdateData = discord.types.voice.VoiceServerUpdate
 
+type Event = TrackStartEvent | TrackEndEvent | TrackExceptionEvent | TrackStuckEvent | WebSocketClosedEvent
+
+# maps lavalink event types to their event class and precomputed dispatch name.
+_EVENT_MAPPING: dict[str, tuple[type[Event], str]] = {
+    event_type: (event_class, get_event_dispatch_name(event_type))
+    for event_type, event_class in [
+        ("TrackStartEvent",      TrackStartEvent),
+        ("TrackEndEvent",        TrackEndEvent),
+        ("TrackExceptionEvent",  TrackExceptionEvent),
+        ("TrackStuckEvent",      TrackStuckEvent),
+        ("WebSocketClosedEvent", WebSocketClosedEvent),
+    ]
+}
+
+
+def _validate_volume(volume: int, /) -> None:
+    if volume < 0 or volume > 1000:
+        raise TypeError("'volume' must be an integer between '0' and '1000' inclusive.")
+
 
 class Player(discord.VoiceProtocol, Generic[BotT]):
+    __slots__ = (
+        "_bot", "_guild", "_channel", "_link", "_path", "_path_session_id", "_token", "_endpoint", "_session_id",
+        "_last_voice_state", "_connected", "_ping", "_position", "_time", "_received_at", "_track", "_filter",
+        "_paused", "_volume", "_data_session_id",
+    )
 
     def __init__(self, link: Link) -> None:
         self._bot: BotT = MISSING
         self._guild: discord.Guild = MISSING
         self._channel: VoiceChannel | None = MISSING
         self._link: Link = link
+        self._path: str = MISSING
+        self._path_session_id: str | None = MISSING
         # player voice state
         self._token: str | None = None
         self._endpoint: str | None = None
         self._session_id: str | None = None
+        self._last_voice_state: tuple[str | None, str, str, str] | None = None
         # player state
         self._connected: bool = False
         self._ping: int = -1
         self._position: int = 0
         self._time: int = 0
+        self._received_at: int = time.monotonic_ns() // 1_000_000
         # player data
         self._track: Track | None = None
         self._filter: Filter | None = None
         self._paused = False
         self._volume = 100
+        self._data_session_id: str | None = None
 
     def __call__(self, client: discord.Client, channel: Connectable) -> Player:
         self._bot = client                         # type: ignore
@@ -86,40 +114,43 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
     # voice state update
 
     async def on_voice_state_update(self, data: VoiceStateUpdateData, /) -> None:
-        __log__.debug(
-            f"Player ({self.guild.id} : {self.guild.name}) received a 'VOICE_STATE_UPDATE' from Discord.\n"
-            f"%s", DeferredMessage(json.dumps, data, indent=4),
-        )
+        guild = self._guild
+        if __log__.isEnabledFor(logging.DEBUG):
+            __log__.debug(
+                "Player (%s : %s) received a 'VOICE_STATE_UPDATE' from Discord.\n%s",
+                guild.id, guild.name, DeferredMessage(json_dumps_pretty, data),
+            )
         # set discord voice state data
         self._session_id = data["session_id"]
         await self._update_voice_state()
         # update player voice channel
         id: int | None = int(channel_id) if (channel_id := data["channel_id"]) else None  # type: ignore
-        channel: VoiceChannel | None = self.guild.get_channel(id)  # type: ignore
+        channel: VoiceChannel | None = guild.get_channel(id)  # type: ignore
         if self._channel == channel:
             return
         elif self._channel is not None and channel is None:
             __log__.info(
-                f"Player ({self.guild.id} : {self.guild.name}) disconnected from voice channel "
-                f"({self._channel.id} : {self._channel.name})."
+                "Player (%s : %s) disconnected from voice channel (%s : %s).",
+                guild.id, guild.name, self._channel.id, self._channel.name,
             )
         elif self._channel is None and channel is not None:
             __log__.info(
-                f"Player ({self.guild.id} : {self.guild.name}) connected to voice channel "
-                f"({channel.id} : {channel.name})."
+                "Player (%s : %s) connected to voice channel (%s : %s).",
+                guild.id, guild.name, channel.id, channel.name,
             )
         elif self._channel is not None and channel is not None:
             __log__.info(
-                f"Player ({self.guild.id} : {self.guild.name}) moved from voice channel "
-                f"({self._channel.id} : {self._channel.name}) to ({channel.id} : {channel.name})."
+                "Player (%s : %s) moved from voice channel (%s : %s) to (%s : %s).",
+                guild.id, guild.name, self._channel.id, self._channel.name, channel.id, channel.name,
             )
         self._channel = channel
 
     async def on_voice_server_update(self, data: VoiceServerUpdateData, /) -> None:
-        __log__.debug(
-            f"Player ({self.guild.id} : {self.guild.name}) received a 'VOICE_SERVER_UPDATE' from Discord.\n"
-            f"%s", DeferredMessage(json.dumps, data, indent=4),
-        )
+        if __log__.isEnabledFor(logging.DEBUG):
+            __log__.debug(
+                "Player (%s : %s) received a 'VOICE_SERVER_UPDATE' from Discord.\n%s",
+                self.guild.id, self.guild.name, DeferredMessage(json_dumps_pretty, data),
+            )
         # set discord voice state data
         self._token = data["token"]
         self._endpoint = data["endpoint"]
@@ -129,11 +160,15 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         # check if all the data required to update the player's voice state is available
         if self._token is None or self._endpoint is None or self._session_id is None:
             return
-        # update the player's voice state
-        await self._link._request(
-            "PATCH", f"/v4/sessions/{self._link.session_id}/players/{self.guild.id}",
-            data={"voice": {"token": self._token, "endpoint": self._endpoint, "sessionId": self._session_id}},
-        )
+        # update the player's voice state, unless lavalink already has this exact voice state. the link's
+        # session id is included so that a new lavalink session always receives it.
+        voice_state = (self._link._session_id, self._token, self._endpoint, self._session_id)
+        if voice_state != self._last_voice_state:
+            # '_request' returns None for non-2xx responses, only remember voice states lavalink accepted.
+            if await self._patch(
+                data={"voice": {"token": self._token, "endpoint": self._endpoint, "sessionId": self._session_id}},
+            ) is not None:
+                self._last_voice_state = voice_state
         # reset the discord voice state data to disallow subsequent 'VOICE_STATE_UPDATE'
         # events from updating the player's voice state unnecessarily
         self._token, self._endpoint, self._session_id = None, None, None
@@ -141,27 +176,22 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
     # events + player updates
 
     def _dispatch_event(self, payload: EventPayload, /) -> None:
-        match payload["type"]:
-            case "TrackStartEvent":
-                event = TrackStartEvent(payload)
-            case "TrackEndEvent":
-                event = TrackEndEvent(payload)
-            case "TrackExceptionEvent":
-                event = TrackExceptionEvent(payload)
-            case "TrackStuckEvent":
-                event = TrackStuckEvent(payload)
-            case "WebSocketClosedEvent":
-                event = WebSocketClosedEvent(payload)
-            case _:  # pyright: ignore - lavalink could add new event types
-                event = UnhandledEvent(payload)
-        self._bot.dispatch(get_event_dispatch_name(event.type), self, event)
-        __log__.info(f"Player ({self.guild.id} : {self.guild.name}) dispatched '{event}'")
+        try:
+            event_class, dispatch_name = _EVENT_MAPPING[payload["type"]]
+        except KeyError:
+            # lavalink could add new event types, so fall back to 'UnhandledEvent' for unknown ones.
+            event_class, dispatch_name = UnhandledEvent, get_event_dispatch_name(payload["type"])
+        event = event_class(payload)  # type: ignore
+        self._bot.dispatch(dispatch_name, self, event)
+        __log__.info("Player (%s : %s) dispatched '%s'", self.guild.id, self.guild.name, event)
 
     def _update_player_state(self, payload: PlayerStateData, /) -> None:
         self._connected = payload["connected"]
         self._ping = payload["ping"]
         self._position = payload["position"]
         self._time = payload["time"]
+        # when the state was received, on the monotonic clock, so 'position' can't be skewed by wall clock changes.
+        self._received_at = time.monotonic_ns() // 1_000_000
 
     def _update_player_data(self, data: PlayerData) -> None:
         self._update_player_state(data["state"])
@@ -169,9 +199,48 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         # self._filter = Filter(data["filters"])
         self._volume = data["volume"]
         self._paused = data["paused"]
+        self._data_session_id = self._link._session_id
+
+    def _reset_stale_data(self) -> None:
+        # a new lavalink session starts this player from scratch, so data recorded under an older one is stale.
+        if self._data_session_id != self._link._session_id:
+            self._data_session_id = self._link._session_id
+            self._filter = None
+            self._paused = False
+            self._volume = 100
 
     # methods
 
+    def _get_path(self) -> str:
+        # the path only changes when the link gets a new session id, so only rebuild it then.
+        if (session_id := self._link._session_id) != self._path_session_id:
+            self._path_session_id = session_id
+            self._path = f"/v4/sessions/{session_id}/players/{self.guild.id}"
+        return self._path
+
+    async def _patch(
+        self,
+        *,
+        parameters: UpdatePlayerRequestParameters | None = None,
+        data: UpdatePlayerRequestData,
+    ) -> PlayerData | None:
+        return await self._link._request("PATCH", self._get_path(), parameters=parameters, data=data)
+
+    async def _send_update(
+        self,
+        data: UpdatePlayerRequestData,
+        /, *,
+        parameters: UpdatePlayerRequestParameters | None = None,
+    ) -> PlayerData:
+        # wait for the player to be ready
+        link = self._link
+        if not link._ready_event.is_set():
+            await link._ready_event.wait()
+        if (player := await self._patch(parameters=parameters, data=data)) is None:
+            raise PlayerUpdateFailed(f"Failed to update the player for guild '{self.guild.id}'.")
+        self._update_player_data(player)
+        return player
+
     async def update(
         self,
         *,
@@ -188,9 +257,28 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         # validate that track and track_identifier are not used at the same time
         if track is not MISSING and track_identifier is not MISSING:
             raise ValueError("'track' and 'track_identifier' can not be used at the same time.")
-        # wait for the player to be ready
-        if not self._link.is_ready():
-            await self._link._ready_event.wait()
+        # validate the remaining values up front so that building the request data can't fail
+        if isinstance(track_end_time, int) and track_end_time <= 0:
+            raise TypeError("'track_end_time' must be an integer more than or equal to '1'.")
+        if volume is not MISSING:
+            _validate_volume(volume)
+        # drop values that match the player's current state, filters are immutable so re-applying the
+        # current one doesn't need to be sent again either
+        self._reset_stale_data()
+        if filter is not MISSING and filter is self._filter:
+            filter = MISSING
+        if paused is not MISSING and paused == self._paused:
+            paused = MISSING
+        if volume is not MISSING and volume == self._volume:
+            volume = MISSING
+        # don't send a request if nothing would change, 'replace_current_track' on its own is a no-op because
+        # it only affects how a new track is handled.
+        if all(
+            value is MISSING for value in (
+                track, track_identifier, track_user_data, track_end_time, filter, position, paused, volume,
+            )
+        ):
+            return
 
         # prepare request parameters
         parameters: UpdatePlayerRequestParameters = {}
@@ -211,8 +299,6 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         if track_data:
             data["track"] = track_data
         if track_end_time is not MISSING:
-            if isinstance(track_end_time, int) and track_end_time <= 0:
-                raise TypeError("'track_end_time' must be an integer more than or equal to '1'.")
             data["endTime"] = track_end_time
         if filter is not MISSING:
             data["filters"] = filter.data
@@ -221,21 +307,17 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         if paused is not MISSING:
             data["paused"] = paused
         if volume is not MISSING:
-            if volume < 0 or volume > 1000:
-                raise TypeError("'volume' must be an integer between '0' and '1000' inclusive.")
             data["volume"] = volume
 
-        # send request
-        player: PlayerData = await self._link._request(
-            "PATCH", f"/v4/sessions/{self._link.session_id}/players/{self.guild.id}",
-            parameters=parameters, data=data,
-        )
-        self._update_player_data(player)
+        # send request, only record the filter if lavalink actually applied it
+        await self._send_update(data, parameters=parameters)
+        if filter is not MISSING:
+            self._filter = filter
 
     # connection
 
     def is_connected(self) -> bool:
-        return self._channel is not None and self._connected is True
+        return self._connected and self._channel is not None
 
     async def connect(
         self, *,
@@ -249,10 +331,11 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
             raise PlayerAlreadyConnected("This player is already connected to a voice channel.")
         if self._channel is None and channel is None:
             raise ValueError("You must provide the 'channel' parameter to reconnect this player.")
-        self._channel = cast(VoiceChannel, self._channel or channel)
+        self._channel = self._channel or channel
+        assert self._channel is not None
         __log__.info(
-            f"Player ({self.guild.id} : {self.guild.name}) connected to voice channel "
-            f"({self._channel.id} : {self._channel.name})."
+            "Player (%s : %s) connected to voice channel (%s : %s).",
+            self.guild.id, self.guild.name, self._channel.id, self._channel.name,
         )
         await self.guild.change_voice_state(channel=self._channel)
 
@@ -261,31 +344,47 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
             raise PlayerNotConnected("This player is not connected to a voice channel.")
         self._channel = channel
         __log__.info(
-            f"Player ({self.guild.id} : {self.guild.name}) moved from voice channel "
-            f"({self._channel.id} : {self._channel.name}) to ({channel.id} : {channel.name})."
+            "Player (%s : %s) moved from voice channel (%s : %s) to (%s : %s).",
+            self.guild.id, self.guild.name, self._channel.id, self._channel.name, channel.id, channel.name,
         )
         await self.guild.change_voice_state(channel=self._channel)
 
     async def disconnect(self, *, force: bool = False) -> None:
         if not self.is_connected():
             raise PlayerNotConnected("This player is not connected to a voice channel.")
-        old_channel = cast(VoiceChannel, self._channel)
+        old_channel = self._channel
+        assert old_channel is not None
         self._channel = None
+        self._last_voice_state = None
         __log__.info(
-            f"Player ({self.guild.id} : {self.guild.name}) disconnected from voice channel "
-            f"({old_channel.id} : {old_channel.name})."
+            "Player (%s : %s) disconnected from voice channel (%s : %s).",
+            self.guild.id, self.guild.name, old_channel.id, old_channel.name,
         )
         await self.guild.change_voice_state(channel=self._channel)
 
+    async def destroy(self) -> None:
+        if self.is_connected():
+            await self.disconnect()
+        # delete the lavalink player, otherwise lavalink keeps it around and sends events for it.
+        if self._link._session_id is not None:
+            await self._link._request("DELETE", self._get_path())
+        self.cleanup()
+        __log__.info("Player (%s : %s) was destroyed.", self.guild.id, self.guild.name)
+
+    def cleanup(self) -> None:
+        # stop both the link and discord.py from holding onto this player.
+        self._link._players.pop(self.guild.id, None)
+        self._bot._connection._remove_voice_client(self.guild.id)  # type: ignore
+
     # position
 
     @property
     def position(self) -> int:
-        return round(self._position + ((time.time() * 1000) - self._time))
+        return self._position + (time.monotonic_ns() // 1_000_000 - self._received_at)
 
     async def set_position(self, position: int, /) -> None:
-        await self.update(position=position)
-        __log__.info(f"Player ({self.guild.id} : {self.guild.name}) set it's position to '{self.position}'.")
+        await self._send_update({"position": position})
+        __log__.info("Player (%s : %s) set it's position to '%s'.", self.guild.id, self.guild.name, self.position)
 
     # track
 
@@ -302,12 +401,13 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
     ) -> None:
         await self.update(track=track, track_end_time=end_time, replace_current_track=replace_current_track)
         __log__.info(
-            f"Player ({self.guild.id} : {self.guild.name}) started playing '{track.title}' by '{track.author}'."
+            "Player (%s : %s) started playing '%s' by '%s'.",
+            self.guild.id, self.guild.name, track.title, track.author,
         )
 
     async def stop(self) -> None:
         await self.update(track=None)
-        __log__.info(f"Player ({self.guild.id} : {self.guild.name}) stopped playing.")
+        __log__.info("Player (%s : %s) stopped playing.", self.guild.id, self.guild.name)
 
     # filter
 
@@ -321,8 +421,12 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         /, *,
         instant: bool = True
     ) -> None:
+        # re-applying the current filter would only send a pointless seek
+        self._reset_stale_data()
+        if filter is self._filter:
+            return
         await self.update(filter=filter, position=self.position if instant else MISSING)
-        __log__.info(f"Player ({self.guild.id} : {self.guild.name}) set it's filter to '{filter}'.")
+        __log__.info("Player (%s : %s) set it's filter to '%s'.", self.guild.id, self.guild.name, filter)
 
     # paused
 
@@ -333,8 +437,11 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         await self.set_pause_state(True)
 
     async def set_pause_state(self, state: bool, /) -> None:
-        await self.update(paused=state)
-        __log__.info(f"Player ({self.guild.id} : {self.guild.name}) set it's paused state to '{state}'.")
+        self._reset_stale_data()
+        if state == self._paused:
+            return
+        await self._send_update({"paused": state})
+        __log__.info("Player (%s : %s) set it's paused state to '%s'.", self.guild.id, self.guild.name, state)
 
     async def resume(self) -> None:
         await self.set_pause_state(False)
@@ -346,4 +453,8 @@ class Player(discord.VoiceProtocol, Generic[BotT]):
         return self._volume
 
     async def set_volume(self, volume: int, /) -> None:
-        await self.update(volume=volume)
+        _validate_volume(volume)
+        self._reset_stale_data()
+        if volume == self._volume:
+            return
+        await self._send_update({"volume": volume})
@@ -6,7 +6,7 @@ import spotipy
 
 
 type JSON = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
-type JSONDumps = Callable[[JSON], str]
+type JSONDumps = Callable[[JSON], str | bytes]
 type JSONLoads = Callable[..., JSON]
 
 type VoiceChannel = discord.channel.VocalGuildChannel
@@ -299,4 +299,4 @@ type RequestData = (
 class RequestKwargs(TypedDict):
     headers: RequestHeaders
     params: NotRequired[RequestParameters | None]
-    data: NotRequired[str | None]
+    data: NotRequired[str | bytes | None]